@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 import os
 import subprocess
+import tempfile
 import datetime
 
+# first lines of a commit's entry in the Details block, filled per commit
+DETAIL_HEAD = "- {short} — {subject} ({name})\n  - Date: {date}\n"
+
 def run_git(args):
-    return subprocess.check_output(args, text=True)
+    # with -z git writes paths as raw bytes, which need not be valid utf-8
+    return subprocess.check_output(args, text=True, errors='replace')
 
 def main():
     input_date = os.environ.get('INPUT_DATE') or os.environ.get('TARGET_DATE')
@@ -16,14 +21,23 @@ def main():
     since = f"{target_date}T00:00:00"
     until = f"{target_date}T23:59:59"
     author = os.environ.get('WORKLOG_AUTHOR_EMAIL') or os.environ.get('WORKLOG_AUTHOR')
+    # WORKLOG_DETAILED=0 writes only the bullet list, so git needs neither
+    # the commit bodies nor a diff per commit for the file lists
+    detailed = os.environ.get('WORKLOG_DETAILED', '1') != '0'
+    # one `git log` for the whole day: each record starts with \x1e, the
+    # header (ending with the full body) is closed by \x1f and followed by
+    # the NUL-separated list of files changed
     args = [
         'git',
         'log',
         f"--since={since}",
         f"--until={until}",
-        "--pretty=format:%H|%an|%ae|%ad|%s",
+        f"--pretty=format:%x1e%H%x01%an%x01%ae%x01%ad%x01%s%x01{'%B' if detailed else ''}%x1f",
         "--date=iso",
+        "-z",
     ]
+    if detailed:
+        args.append("--name-only")
     try:
         output = run_git(args)
     except subprocess.CalledProcessError:
@@ -32,96 +46,85 @@ def main():
     if not output.strip():
         print('No commits for', target_date)
         return
-    lines = [l for l in output.splitlines()]
-    if author:
-        lines = [l for l in lines if f'|{author}|' in l or l.split('|')[2] == author]
-    if not lines:
-        print('No commits for author on', target_date)
-        return
-    bullets = []
     details = []
-    for l in lines:
-        sha, name, email, date, subject = l.split('|', 4)
-        short = sha[:7]
-        bullets.append(f"- {short} — {subject} ({name})")
-        # get files changed
-        try:
-            files_out = run_git(['git', 'show', '--name-only', '--pretty=format:', sha])
-            files = [f for f in files_out.splitlines() if f.strip()]
-        except subprocess.CalledProcessError:
-            files = []
-        # get full commit body
-        try:
-            body_out = run_git(['git', 'show', '--pretty=format:%B', '-s', sha])
-        except subprocess.CalledProcessError:
-            body_out = ''
+    for record in output.split('\x1e')[1:]:
+        header, _, tail = record.partition('\x1f')
+        sha, name, email, date, subject, body = header.split('\x01', 5)
+        # WORKLOG_AUTHOR(_EMAIL) may hold either the name or the email
+        if author and author != email and author != name:
+            continue
         details.append({
             'sha': sha,
-            'short': short,
+            'short': sha[:7],
             'name': name,
             'email': email,
             'date': date,
             'subject': subject,
-            'files': files,
-            'body': body_out.strip(),
+            # one newline separates the header from the NUL-terminated paths
+            'files': [f for f in tail.removeprefix('\n').split('\x00') if f],
+            'body': body.strip(),
         })
+    if not details:
+        print('No commits for author on', target_date)
+        return
+    bullets = [f"- {d['short']} — {d['subject']} ({d['name']})" for d in details]
 
     header = f"### {target_date} — Commits summary\n\n"
-    summary_block = header + "\n".join(bullets) + "\n\n"
-    # Build detailed block
-    details_block = "#### Details\n\n"
-    for d in details:
-        details_block += f"- {d['short']} — {d['subject']} ({d['name']})\n"
-        details_block += f"  - Date: {d['date']}\n"
-        if d['files']:
-            details_block += f"  - Files:\n"
-            for f in d['files']:
-                details_block += f"    - {f}\n"
-        if d['body']:
-            # indent body lines
-            body_lines = d['body'].splitlines()
-            details_block += f"  - Message:\n"
-            for bl in body_lines:
-                details_block += f"    {bl}\n"
-        details_block += "\n"
+    summary_block = "".join([header, "\n".join(bullets), "\n\n"])
+    parts = [summary_block]
+    if detailed:
+        # Build detailed block
+        parts.append("#### Details\n\n")
+        for d in details:
+            parts.append(DETAIL_HEAD.format_map(d))
+            if d['files']:
+                parts.append("  - Files:\n    - ")
+                parts.append("\n    - ".join(d['files']))
+                parts.append("\n")
+            if d['body']:
+                # indent body lines
+                parts.append("  - Message:\n    ")
+                parts.append("\n    ".join(d['body'].splitlines()))
+                parts.append("\n")
+            parts.append("\n")
+    body = "".join(parts)
 
-    body = summary_block + details_block
     monthfile = os.path.join('worklogs', target_date[:7] + '.md')
-    if not os.path.exists('worklogs'):
-        os.makedirs('worklogs', exist_ok=True)
-    if not os.path.exists(monthfile):
-        if os.path.exists('WORKLOG-TEMPLATE.md'):
+    os.makedirs('worklogs', exist_ok=True)
+    try:
+        # Read existing content and replace existing block for the target_date if present
+        with open(monthfile, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        try:
             with open('WORKLOG-TEMPLATE.md', 'r', encoding='utf-8') as t:
-                tmpl = t.read()
-            with open(monthfile, 'w', encoding='utf-8') as f:
-                f.write(tmpl + '\n')
-        else:
-            with open(monthfile, 'w', encoding='utf-8') as f:
-                f.write(f"# Worklog - {target_date[:7]}\n\n")
-
-    # Read existing content and replace existing block for the target_date if present 
-    with open(monthfile, 'r', encoding='utf-8') as f:
-        content = f.read()
+                content = t.read() + '\n'
+        except FileNotFoundError:
+            content = f"# Worklog - {target_date[:7]}\n\n"
 
     start_marker = f"### {target_date} — Commits summary"
-    if start_marker in content:
+    idx = content.find(start_marker)
+    if idx != -1:
         # remove existing block from start_marker to next '### ' or EOF
-        parts = content.split(start_marker, 1)
-        prefix = parts[0]
-        rest = parts[1]
-        # find next '### ' occurrence
-        next_idx = rest.find('\n### ')
-        if next_idx != -1:
-            suffix = rest[next_idx+1:]
-        else:
-            suffix = ''
-        new_content = prefix + start_marker + '\n\n' + body + suffix
+        end = content.find('\n### ', idx + len(start_marker))
+        suffix = content[end + 1:] if end != -1 else ''
+        new_content = ''.join([content[:idx], start_marker, '\n\n', body, suffix])
     else:
         new_content = content + '\n' + body
 
-    with open(monthfile, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    print('Updated worklog with detailed summary:', monthfile)
+    # write the month file once, through a 1 MiB buffer, into a temp file
+    # that is renamed over monthfile so an interrupted run can't truncate it
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', buffering=1 << 20,
+                                      dir='worklogs', prefix='.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(new_content)
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, monthfile)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    print('Updated worklog with detailed summary:' if detailed else 'Updated worklog with summary:', monthfile)
 
 if __name__ == '__main__':
     main()
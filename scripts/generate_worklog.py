@@ -13,12 +13,64 @@ header when present and appends daily commit summaries grouped by date.
 from __future__ import annotations
 import subprocess
 import sys
+import tempfile
 import datetime
+import functools
+import io
+import itertools
 import re
 import os
-from collections import defaultdict
+import pathlib
 from typing import List
 
+# git, worklogs/ and assets/ all refer to the repository the script is run from
+REPO_ROOT = pathlib.Path.cwd().resolve()
+WORKLOGS_DIR = REPO_ROOT / "worklogs"
+ASSETS_ROOT = REPO_ROOT / "assets"
+# the template ships with the scripts, one level above this file
+TEMPLATE_PATH = pathlib.Path(__file__).resolve().parent.parent / "WORKLOG-TEMPLATE.md"
+
+# worklog files are rebuilt in memory and written out in one go
+WRITE_BUFFER_SIZE = 1 << 20
+# git log output is parsed as it streams in, up to this many bytes at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+GIT_PIPE_BUFFER_SIZE = 1 << 20
+# files listed per commit in the details; the rest are only counted
+MAX_FILES_LISTED = 20
+
+# a day's section runs from its heading (at line start) to the next `###` heading or EOF
+HEADING_RE = re.compile(r"(?m)^###\s")
+DAY_HEADING_RE = re.compile(r"###\s+(\d{4}-\d{2}-\d{2}) — Commits summary")
+# every YYYY-MM-DD inside an asset name, overlapping ones included
+DATE_IN_NAME_RE = re.compile(r"(?=(\d{4}-\d{2}-\d{2}))")
+
+
+# month summary: shields.io badges followed by the totals table
+MONTH_SUMMARY_TMPL = (
+    "![commits](https://img.shields.io/badge/commits-{c}-blue?style=flat-square) "
+    "![files](https://img.shields.io/badge/files-{f}-informational?style=flat-square) "
+    "![+ins](https://img.shields.io/badge/insertions-%2B{i}-brightgreen?style=flat-square) "
+    "![\\-del](https://img.shields.io/badge/deletions-%2D{d}-red?style=flat-square)"
+    "\n\n\n**Monthly Totals**\n\n"
+    "| Metric | Value |\n"
+    "|---:|---:|\n"
+    "| Commits | {c} |\n"
+    "| Files changed | {f} |\n"
+    "| Insertions | +{i} |\n"
+    "| Deletions | -{d} |\n\n"
+)
+
+
+ASSETS_SECTION_START = "---\n## 📸 Demos & Assets\n\n"
+
+# the last line of a month file records HEAD as of the run that wrote it, and the month totals
+CURSOR_LINE = "<!-- worklog-cursor: {sha} c={commits} f={files_changed} i={insertions} d={deletions} -->\n"
+CURSOR_RE = re.compile(
+    r"^<!-- worklog-cursor: (?P<sha>[0-9a-f]{40}) "
+    r"c=(?P<commits>\d+) f=(?P<files_changed>\d+) i=(?P<insertions>\d+) d=(?P<deletions>\d+) -->\n?\Z",
+    re.M,
+)
+
 
 def run_git(args):
     proc = subprocess.run(["git"] + args, capture_output=True, text=True)
@@ -26,36 +78,89 @@ def run_git(args):
     return proc.stdout
 
 
-def get_commits(since: datetime.datetime, until: datetime.datetime):
-    fmt = "%H%x01%ad%x01%an%x01%s"
+def iter_git_records(args, sep: bytes):
+    """Yield the raw `sep`-delimited records of `git <args>` output while git is still producing it."""
+    with subprocess.Popen(["git"] + args, stdout=subprocess.PIPE, bufsize=GIT_PIPE_BUFFER_SIZE) as proc:
+        pending = b""
+        # read1 hands over whatever git has written so far instead of waiting for a full chunk
+        for chunk in iter(lambda: proc.stdout.read1(STREAM_CHUNK_SIZE), b""):
+            *records, pending = (pending + chunk).split(sep)
+            yield from (r for r in records if r)
+        if pending:
+            yield pending
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def get_commits(since: datetime.datetime, until: datetime.datetime, revs: str | None = None):
+    """Return the window's commits (newest first) with their files and line counts.
+
+    `revs` narrows the walk to a revision range such as `<sha>..HEAD`.
+    """
+    # one `git log` for the whole window: each record starts with \x1e, the
+    # header ends with \x1f and is followed by the NUL-separated numstat rows
+    fmt = "%x1e%H%x01%ad%x01%an%x01%s%x1f"
     args = [
         "log",
         f"--since={since.isoformat()}",
         f"--until={until.isoformat()}",
         f"--pretty=format:{fmt}",
-        "--date=iso-strict",
+        "--date=unix",
+        "--numstat",
+        "-z",
     ]
-    out = run_git(args)
+    if revs:
+        args.append(revs)
     commits = []
-    for line in out.splitlines():
-        parts = line.split("\x01")
+    for record in iter_git_records(args, b"\x1e"):
+        header, _, tail = record.partition(b"\x1f")
+        parts = header.split(b"\x01")
         if len(parts) < 4:
             continue
-        sha, datestr, author, subject = parts[:4]
-        try:
-            dt = datetime.datetime.fromisoformat(datestr)
-        except Exception:
-            # fallback to naive parsing
-            dt = datetime.datetime.strptime(datestr, "%Y-%m-%d %H:%M:%S %z")
-        commits.append({"sha": sha, "date": dt, "author": author, "message": subject})
+        sha_b, date_b, author_b, subject_b = parts[:4]
+        # the sha and the unix date are plain ASCII; only the free-text fields need utf-8
+        sha = sha_b.decode("ascii")
+        author = author_b.decode("utf-8", errors="replace")
+        subject = subject_b.decode("utf-8", errors="replace")
+        # converted to local time once here; the builders group and print by local date,
+        # so both are precomputed along with the short sha
+        dt = datetime.datetime.fromtimestamp(int(date_b), tz=datetime.timezone.utc).astimezone()
+        files = []
+        files_total = insertions = deletions = 0
+        # git puts exactly one newline between the header and the rows;
+        # each row is "<ins>\t<del>\t<path>\0", or "<ins>\t<del>\t\0<old>\0<new>\0" for a rename
+        rows = iter(tail.removeprefix(b"\n").split(b"\x00"))
+        for row in rows:
+            if not row:
+                continue
+            ins, dels, path = row.split(b"\t", 2)
+            if not path:
+                next(rows)
+                path = next(rows)
+            if files_total < MAX_FILES_LISTED:
+                # paths are arbitrary bytes; undecodable ones are spelled as \xNN so the worklog stays valid utf-8
+                files.append(path.decode("utf-8", errors="backslashreplace"))
+            files_total += 1
+            # binary files report "-" for both counts
+            if ins != b"-":
+                insertions += int(ins)
+                deletions += int(dels)
+        commits.append({
+            "sha": sha,
+            "short": sha[:7],
+            "date": dt,
+            "local_date": dt.date(),
+            "local_date_str": dt.strftime("%Y-%m-%d %H:%M:%S %z"),
+            "author": author,
+            "message": subject,
+            "files": files,
+            "files_total": files_total,
+            "insertions": insertions,
+            "deletions": deletions,
+        })
     return commits
 
 
-def get_files_for_commit(sha: str):
-    out = run_git(["show", "--name-only", "--pretty=format:", "--no-patch", sha])
-    return [l for l in out.splitlines() if l.strip()]
-
-
 def month_range(year: int, month: int):
     start = datetime.datetime(year, month, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
     if month == 12:
@@ -65,142 +170,153 @@ def month_range(year: int, month: int):
     return start, end
 
 
+@functools.lru_cache(maxsize=1)
 def load_template():
-    tpl_path = os.path.join(os.getcwd(), "WORKLOG-TEMPLATE.md")
-    if os.path.exists(tpl_path):
-        with open(tpl_path, "r", encoding="utf-8") as f:
-            return f.read()
-    # minimal fallback header
-    return "# {Month YYYY} — Monthly Worklog\n\n" 
+    try:
+        return TEMPLATE_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        # minimal fallback header
+        return "# {Month YYYY} — Monthly Worklog\n\n"
 
 
+@functools.lru_cache(maxsize=64)
 def format_month_header(template: str, year: int, month: int):
     name = datetime.date(year, month, 1).strftime("%B %Y")
     return template.replace("{Month YYYY}", name)
 
 
+def render_commit_summary(c: dict) -> str:
+    """Return the summary bullet for one commit."""
+    return f"- {c['short']} — {c['message']} ({c['author']})\n"
+
+
+def render_commit_detail(c: dict) -> str:
+    """Return the whole details entry for one commit; shared by the month and day builders."""
+    files = c["files"]
+    if files:
+        files_md = "  - Files:\n" + "".join([f"    - {f}\n" for f in files])
+        if c["files_total"] > len(files):
+            files_md += f"    - … ({c['files_total'] - len(files)} more)\n"
+    else:
+        files_md = "  - Files: (none)\n"
+    return (
+        f"{render_commit_summary(c)}"
+        f"  - Date: {c['local_date_str']}\n"
+        f"{files_md}"
+        f"  - Message:\n"
+        f"    - {c['message']}\n\n"
+    )
+
+
+def build_month_summary(year: int, month: int, stats: dict) -> str:
+    commits_n = stats.get("commits", 0)
+    files_n = stats.get("files_changed", 0)
+    ins = stats.get("insertions", 0)
+    dels = stats.get("deletions", 0)
+    return MONTH_SUMMARY_TMPL.format(c=commits_n, f=files_n, i=ins, d=dels)
+
+
+def render_day_section(day: datetime.date, day_commits) -> str:
+    """Return one day's section of the month file: the summary bullets, then the details."""
+    return "".join([
+        f"### {day.isoformat()} — Commits summary\n\n",
+        *map(render_commit_summary, day_commits),
+        "\n#### Details\n\n",
+        *map(render_commit_detail, day_commits),
+    ])
+
+
 def build_markdown(year: int, month: int, commits):
     tpl = load_template()
     header = format_month_header(tpl, year, month)
-    lines = [header, "\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
+    w("\n")
 
     # month summary (badges + table)
     month_stats = compute_stats_for_commits(commits)
-    def build_month_summary(year: int, month: int, stats: dict) -> str:
-        commits_n = stats.get("commits", 0)
-        files_n = stats.get("files_changed", 0)
-        ins = stats.get("insertions", 0)
-        dels = stats.get("deletions", 0)
-        badges = []
-        badges.append(f"![commits](https://img.shields.io/badge/commits-{commits_n}-blue?style=flat-square)")
-        badges.append(f"![files](https://img.shields.io/badge/files-{files_n}-informational?style=flat-square)")
-        badges.append(f"![+ins](https://img.shields.io/badge/insertions-%2B{ins}-brightgreen?style=flat-square)")
-        badges.append(f"![\-del](https://img.shields.io/badge/deletions-%2D{dels}-red?style=flat-square)")
-        table = ["\n", "**Monthly Totals**\n\n", "| Metric | Value |\n", "|---:|---:|\n"]
-        table.append(f"| Commits | {commits_n} |\n")
-        table.append(f"| Files changed | {files_n} |\n")
-        table.append(f"| Insertions | +{ins} |\n")
-        table.append(f"| Deletions | -{dels} |\n\n")
-        return " ".join(badges) + "\n\n" + "".join(table)
-
-    lines.append(build_month_summary(year, month, month_stats))
-
-    # group commits by local date
-    groups = defaultdict(list)
-    for c in commits:
-        local_date = c["date"].astimezone().date()
-        groups[local_date].append(c)
-
-    for day in sorted(groups.keys()):
-        day_str = day.isoformat()
-        lines.append(f"### {day_str} — Commits summary\n\n")
-        for c in groups[day]:
-            short = c["sha"][:7]
-            lines.append(f"- {short} — {c['message']} ({c['author']})\n")
-        lines.append("\n#### Details\n\n")
-        for c in groups[day]:
-            short = c["sha"][:7]
-            lines.append(f"- {short} — {c['message']} ({c['author']})\n")
-            lines.append(f"  - Date: {c['date'].astimezone().strftime('%Y-%m-%d %H:%M:%S %z')}\n")
-            files = get_files_for_commit(c["sha"])[:20]
-            if files:
-                lines.append("  - Files:\n")
-                for f in files:
-                    lines.append(f"    - {f}\n")
-            else:
-                lines.append("  - Files: (none)\n")
-            lines.append("  - Message:\n")
-            lines.append(f"    - {c['message']}\n\n")
+    w(build_month_summary(year, month, month_stats))
+
+    # group commits by local date; the sort is stable, so each day keeps git's newest-first order
+    by_day = sorted(commits, key=lambda c: c["local_date"])
+    for day, day_commits in itertools.groupby(by_day, key=lambda c: c["local_date"]):
+        w(render_day_section(day, list(day_commits)))
 
     # append assets section for month (images / links)
     month_assets = find_assets_for_month(year, month)
     if month_assets:
-        lines.append(assets_markdown_for_month(year, month, month_assets))
+        w(assets_markdown_for_month(year, month, month_assets))
 
-    return "".join(lines)
+    return buf.getvalue()
 
 
 def build_day_markdown(day: datetime.date, commits):
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
     day_str = day.isoformat()
-    lines.append(f"### {day_str} — Commits summary\n\n")
+    w(f"### {day_str} — Commits summary\n\n")
     # stats for the day
     stats = compute_stats_for_commits(commits)
     if stats and stats.get("commits", 0) > 0:
-        lines.append("**Stats:** ")
-        lines.append(f"{stats['commits']} commit")
+        w("**Stats:** ")
+        w(f"{stats['commits']} commit")
         if stats['commits'] != 1:
-            lines.append("s")
-        lines.append(" — ")
-        lines.append(f"{stats['files_changed']} files changed")
-        lines.append(" — ")
-        lines.append(f"+{stats['insertions']} / -{stats['deletions']}\n\n")
+            w("s")
+        w(" — ")
+        w(f"{stats['files_changed']} files changed")
+        w(" — ")
+        w(f"+{stats['insertions']} / -{stats['deletions']}\n\n")
     else:
-        lines.append("**Stats:** 0 commits — 0 files changed — +0 / -0\n\n")
+        w("**Stats:** 0 commits — 0 files changed — +0 / -0\n\n")
     for c in commits:
-        short = c["sha"][:7]
-        lines.append(f"- {short} — {c['message']} ({c['author']})\n")
-    lines.append("\n#### Details\n\n")
+        w(render_commit_summary(c))
+    w("\n#### Details\n\n")
     for c in commits:
-        short = c["sha"][:7]
-        lines.append(f"- {short} — {c['message']} ({c['author']})\n")
-        lines.append(f"  - Date: {c['date'].astimezone().strftime('%Y-%m-%d %H:%M:%S %z')}\n")
-        files = get_files_for_commit(c["sha"])[:20]
-        if files:
-            lines.append("  - Files:\n")
-            for f in files:
-                lines.append(f"    - {f}\n")
-        else:
-            lines.append("  - Files: (none)\n")
-        lines.append("  - Message:\n")
-        lines.append(f"    - {c['message']}\n\n")
+        w(render_commit_detail(c))
 
     # include day-specific assets (files named with YYYY-MM-DD prefix or containing the date)
     day_assets = find_assets_for_day(day.year, day.month, day.day)
     if day_assets:
         assets_md = assets_markdown_for_month(day.year, day.month, day_assets)
-        lines.append(assets_md)
+        w(assets_md)
 
-    return "".join(lines)
+    return buf.getvalue()
 
 
 def assets_dir_for_month(year: int, month: int) -> str:
-    return os.path.join(os.getcwd(), "assets", f"{year}-{month:02d}")
+    return os.fspath(ASSETS_ROOT / f"{year}-{month:02d}")
+
+
+@functools.lru_cache(maxsize=32)
+def list_asset_files(dirpath: str) -> tuple:
+    """Return the sorted names of the files in `dirpath` (empty if it doesn't exist), read once per directory."""
+    try:
+        # DirEntry.is_file() answers from the directory listing, no stat per file
+        with os.scandir(dirpath) as entries:
+            return tuple(sorted(e.name for e in entries if e.is_file()))
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
+@functools.lru_cache(maxsize=32)
+def asset_files_by_date(dirpath: str) -> dict:
+    """Index the files in `dirpath` by every YYYY-MM-DD date their name contains (sorted within each date)."""
+    index = {}
+    for name in list_asset_files(dirpath):
+        for date in dict.fromkeys(DATE_IN_NAME_RE.findall(name)):
+            index.setdefault(date, []).append(name)
+    return index
 
 
 def find_assets_for_month(year: int, month: int) -> List[str]:
-    d = assets_dir_for_month(year, month)
-    if not os.path.isdir(d):
-        return []
-    files = [f for f in os.listdir(d) if os.path.isfile(os.path.join(d, f))]
-    files.sort()
-    return files
+    return list(list_asset_files(assets_dir_for_month(year, month)))
 
 
 def assets_markdown_for_month(year: int, month: int, files: List[str]) -> str:
     if not files:
         return ""
-    lines = ["---\n", "## 📸 Demos & Assets\n\n"]
+    lines = [ASSETS_SECTION_START]
     assets_path = f"/assets/{year}-{month:02d}"
     for fn in files:
         ext = fn.lower().rsplit('.', 1)[-1] if '.' in fn else ''
@@ -216,100 +332,177 @@ def assets_markdown_for_month(year: int, month: int, files: List[str]) -> str:
 
 
 def find_assets_for_day(year: int, month: int, day: int) -> List[str]:
-    files = find_assets_for_month(year, month)
     day_prefix = f"{year}-{month:02d}-{day:02d}"
-    matched = [f for f in files if f.startswith(day_prefix) or day_prefix in f]
-    return matched
+    return list(asset_files_by_date(assets_dir_for_month(year, month)).get(day_prefix, ()))
 
 
 def compute_stats_for_commits(commits) -> dict:
     """Return aggregated stats for a list of commits: commits count, files changed, insertions, deletions."""
-    total_commits = len(commits)
-    total_files = 0
-    total_ins = 0
-    total_del = 0
-    for c in commits:
-        sha = c.get("sha")
-        try:
-            out = run_git(["show", "--shortstat", "--pretty=format:", "--no-patch", sha])
-        except Exception:
-            continue
-        # sample output: " 1 file changed, 2 insertions(+), 1 deletion(-)"
-        m_files = re.search(r"(\d+)\s+file[s]? changed", out)
-        m_ins = re.search(r"(\d+)\s+insertion[s]?\(\+\)", out)
-        m_del = re.search(r"(\d+)\s+deletion[s]?\(-\)", out)
-        if m_files:
-            total_files += int(m_files.group(1))
-        if m_ins:
-            total_ins += int(m_ins.group(1))
-        if m_del:
-            total_del += int(m_del.group(1))
-
     return {
-        "commits": total_commits,
-        "files_changed": total_files,
-        "insertions": total_ins,
-        "deletions": total_del,
+        "commits": len(commits),
+        "files_changed": sum(c["files_total"] for c in commits),
+        "insertions": sum(c["insertions"] for c in commits),
+        "deletions": sum(c["deletions"] for c in commits),
     }
 
 
 
+def write_file_atomic(path: pathlib.Path, content: str):
+    """Write `content` to a temp file next to `path` and rename it over `path`, so readers never see a partial file."""
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE,
+        dir=path.parent, prefix=".", suffix=".tmp", delete=False,
+    )
+    try:
+        with tmp:
+            tmp.write(content)
+        # NamedTemporaryFile creates 0600 files; keep the usual repo file mode
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def day_section_spans(text: str) -> dict:
+    """Map each day's ISO date to the (start, end) spans of its sections in file order, in one pass over the file."""
+    spans = {}
+    starts = [m.start() for m in HEADING_RE.finditer(text)]
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        m = DAY_HEADING_RE.match(text, start)
+        if m:
+            spans.setdefault(m.group(1), []).append((start, end))
+    return spans
+
+
 def update_day_in_file(year: int, month: int, day: datetime.date, day_content: str):
-    out_dir = os.path.join(os.getcwd(), "worklogs")
-    os.makedirs(out_dir, exist_ok=True)
-    path = os.path.join(out_dir, f"{year}-{month:02d}.md")
-    if not os.path.exists(path):
+    os.makedirs(WORKLOGS_DIR, exist_ok=True)
+    path = WORKLOGS_DIR / f"{year}-{month:02d}.md"
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         # create new month file with header and day content
         tpl = load_template()
-        header = format_month_header(tpl, year, month)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(header)
-            f.write("\n")
-            f.write(day_content)
-        print(f"Created {path} with {day.isoformat()}")
-        return
-
-    # file exists: replace day's section if present, otherwise append
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    # regex to match the day's section starting at line beginning
-    pattern = rf"(?ms)^(###\s+{re.escape(day.isoformat())} — Commits summary).*?(?=^###\s|\Z)"
-    if re.search(pattern, text):
-        new_text = re.sub(pattern, day_content, text)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(new_text)
-        print(f"Replaced {day.isoformat()} in {path}")
+        new_text = "".join([format_month_header(tpl, year, month), "\n", day_content])
+        action = f"Created {path} with {day.isoformat()}"
     else:
-        # append at end
-        with open(path, "a", encoding="utf-8") as f:
-            f.write("\n")
-            f.write(day_content)
-        print(f"Appended {day.isoformat()} to {path}")
+        # file exists: replace day's section if present, otherwise append
+        spans = day_section_spans(text).get(day.isoformat())
+        if spans:
+            start, end = spans[0]
+            new_text = "".join([text[:start], day_content, text[end:]])
+            action = f"Replaced {day.isoformat()} in {path}"
+        else:
+            # append at end
+            new_text = "".join([text, "\n", day_content])
+            action = f"Appended {day.isoformat()} to {path}"
+
+    # the whole file goes out in one buffered write
+    write_file_atomic(path, new_text)
+    print(action)
+
+
+def update_worklog_since_cursor(year: int, month: int, start: datetime.datetime, end: datetime.datetime) -> bool:
+    """Fold the commits made since the month file's cursor into it; False if it needs a full rebuild instead.
+
+    The header and the assets section are always redone. When there are new commits, the days
+    they fall on are re-rendered from the month's commits and their stats are added to the
+    totals kept in the cursor line. The file is only written if any of that changed it.
+    """
+    path = WORKLOGS_DIR / f"{year}-{month:02d}.md"
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    cursor_m = CURSOR_RE.search(text)
+    if not cursor_m:
+        return False
+    body = text[:cursor_m.start()]
+    cursor = cursor_m.group("sha")
+    totals = {k: int(v) for k, v in cursor_m.groupdict().items() if k != "sha"}
+    # a hand-edited summary no longer matches the totals, so it can't be updated in place
+    old_summary = build_month_summary(year, month, totals)
+    summary_at = body.find(old_summary)
+    if summary_at == -1:
+        return False
+    head = run_git(["rev-parse", "HEAD"]).strip()
+    if head != cursor:
+        try:
+            # a rewritten history can't be diffed against the cursor
+            run_git(["merge-base", "--is-ancestor", cursor, head])
+        except subprocess.CalledProcessError:
+            return False
+    new_commits = get_commits(start, end, f"{cursor}..{head}") if head != cursor else []
+
+    for key, value in compute_stats_for_commits(new_commits).items():
+        totals[key] += value
+    header = format_month_header(load_template(), year, month)
+    summary_end = summary_at + len(old_summary)
+    # (start, end, replacement) edits against `body`, applied in one pass
+    edits = [
+        (0, summary_at, header + "\n"),
+        (summary_at, summary_end, build_month_summary(year, month, totals)),
+    ]
+    assets_at = body.find(ASSETS_SECTION_START, summary_end)
+    if assets_at == -1:
+        assets_at = len(body)
+    spans = day_section_spans(body)
+    # a day written twice (e.g. summarize_commits.py rewriting it in place) isn't this script's layout
+    if any(len(day_spans) > 1 for day_spans in spans.values()):
+        return False
+    if new_commits:
+        new_days = {c["local_date"] for c in new_commits}
+        # days are keyed by author date while git's window is on committer date, so a day's
+        # commits are picked from the whole month, the same list a full rebuild groups
+        by_day = sorted((c for c in get_commits(start, end) if c["local_date"] in new_days),
+                        key=lambda c: c["local_date"])
+        for day, day_commits in itertools.groupby(by_day, key=lambda c: c["local_date"]):
+            section = render_day_section(day, list(day_commits))
+            day_spans = spans.get(day.isoformat())
+            if day_spans:
+                (span_start, span_end), = day_spans
+                # the last day's span runs on to EOF, over the assets section
+                edits.append((span_start, min(span_end, assets_at), section))
+            else:
+                # before the first later day, or after the last day
+                at = min((ds[0][0] for d, ds in spans.items() if d > day.isoformat()), default=assets_at)
+                edits.append((at, at, section))
+    edits.append((assets_at, len(body), assets_markdown_for_month(year, month, find_assets_for_month(year, month))))
+
+    parts = []
+    pos = 0
+    # stable sort: edits sharing a position keep the order they were added in
+    for edit_start, edit_end, replacement in sorted(edits, key=lambda e: e[0]):
+        parts += [body[pos:edit_start], replacement]
+        pos = edit_end
+    parts.append(body[pos:])
+    new_body = "".join(parts)
+    if new_body == body:
+        print(f"No changes for the month since {cursor[:7]}.")
+        return True
+    write_file_atomic(path, new_body + CURSOR_LINE.format(sha=head, **totals))
+    print(f"Updated {path} with {len(new_commits)} new commits")
+    return True
 
 
 def write_day_file(day: datetime.date, day_content: str):
-    out_dir = os.path.join(os.getcwd(), "worklogs")
-    os.makedirs(out_dir, exist_ok=True)
-    path = os.path.join(out_dir, f"{day.isoformat()}.md")
+    os.makedirs(WORKLOGS_DIR, exist_ok=True)
+    path = WORKLOGS_DIR / f"{day.isoformat()}.md"
     # build a small daily header
     header = []
     header.append(f"# {day.isoformat()} — Daily Worklog\n")
     header.append("**Author:** Enya Elvis (Elvis)  •  **Timezone:** Africa/Lagos  \n")
     header.append("**Repo:** `enya_elvis.dev_worklog`\n\n")
     header.append("---\n\n")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("".join(header))
-        f.write(day_content)
+    header.append(day_content)
+    write_file_atomic(path, "".join(header))
     print(f"Wrote daily file {path}")
 
 
 def write_worklog(year: int, month: int, content: str):
-    out_dir = os.path.join(os.getcwd(), "worklogs")
-    os.makedirs(out_dir, exist_ok=True)
-    path = os.path.join(out_dir, f"{year}-{month:02d}.md")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    os.makedirs(WORKLOGS_DIR, exist_ok=True)
+    path = WORKLOGS_DIR / f"{year}-{month:02d}.md"
+    write_file_atomic(path, content)
     print(f"Wrote {path}")
 
 
@@ -357,6 +550,7 @@ def main(argv):
         commits = get_commits(start, end)
         if not commits:
             print(f"No commits found for {day.isoformat()}")
+            return
         day_content = build_day_markdown(day, commits)
         # write a standalone daily file (e.g. worklogs/2026-01-05.md)
         write_day_file(day, day_content)
@@ -365,11 +559,16 @@ def main(argv):
     # month mode
     year, month = parsed
     start, end = month_range(year, month)
+    # a month file written by an earlier run only needs the commits made since then
+    if update_worklog_since_cursor(year, month, start, end):
+        return
+    head = run_git(["rev-parse", "HEAD"]).strip()
     commits = get_commits(start, end)
     if not commits:
         print("No commits found for the month.")
+        return
     content = build_markdown(year, month, commits)
-    write_worklog(year, month, content)
+    write_worklog(year, month, content + CURSOR_LINE.format(sha=head, **compute_stats_for_commits(commits)))
 
 
 if __name__ == "__main__":